@@ -4,7 +4,7 @@ Clork ML Training Environment
 Python wrapper for training ML agents on the Clork text adventure game.
 """
 
-from .clork_env import ClorkEnv, ClorkVecEnv, Action, random_agent
+from .clork_env import ClorkEnv, ClorkVecEnv, ClorkObservation, Action, random_agent
 
-__all__ = ["ClorkEnv", "ClorkVecEnv", "Action", "random_agent"]
+__all__ = ["ClorkEnv", "ClorkVecEnv", "ClorkObservation", "Action", "random_agent"]
 __version__ = "0.1.0"
@@ -23,25 +23,105 @@ Usage:
     env.close()
 """
 
+import functools
 import json
 import subprocess
 import os
-from typing import Dict, List, Any, Optional, Tuple
+import selectors
+import struct
+import sys
+import threading
+import time
+from array import array
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
-
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+# JSON codec used on the subprocess pipes. orjson and pysimdjson are optional;
+# decoding prefers orjson, then simdjson, then the standard library, all with
+# the same bytes-in, bytes-out contract.
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    if simdjson is not None:
+        # A simdjson.Parser keeps its internal buffers between parses, so each
+        # thread reuses one (parsers are not thread-safe). recursive=True
+        # returns plain dicts/lists, which stay valid after the next parse.
+        _simdjson_local = threading.local()
+
+        def _json_loads(data: bytes | bytearray) -> Any:
+            parser = getattr(_simdjson_local, "parser", None)
+            if parser is None:
+                parser = _simdjson_local.parser = simdjson.Parser()
+            return parser.parse(bytes(data), True)
+    else:
+        _json_loads = json.loads
+
+# Bytes requested per os.read() on the stdout pipe
+_READ_SIZE = 65536
+
+# Most request bytes step_many() writes ahead of reading their responses. A
+# write can only block once the stdin pipe is full, so keeping the unread
+# requests within the smallest common pipe buffer (16 KiB on macOS, 64 KiB on
+# Linux) means the writer never blocks while the game is blocked writing
+# responses into a full stdout pipe.
+_PIPELINE_BYTES = 16384
+
+# Header for --ml-framed messages: 4-byte big-endian payload length
+_FRAME_HEADER = struct.Struct(">I")
+
+
+# Words treated as movement by the string shorthand in ClorkEnv.step()
+_DIRECTIONS = frozenset({
+    "n", "s", "e", "w", "ne", "nw", "se", "sw",
+    "north", "south", "east", "west",
+    "northeast", "northwest", "southeast", "southwest",
+    "up", "down", "u", "d", "in", "out"
+})
+
+
+@dataclass(frozen=True)
 class Action:
-    """Represents a valid action in Clork."""
+    """
+    Represents a valid action in Clork.
+
+    Actions are immutable; the wire dict and the encoded JSON line are built
+    once at construction and reused every time the action is sent. Cached
+    actions are shared process-wide, so to_dict() hands out copies. The verb,
+    direction and prep come from a small fixed vocabulary and are interned,
+    so equal actions share those strings across ticks.
+    """
     verb: str
     direction: Optional[str] = None
     direct_object: Optional[str] = None
     indirect_object: Optional[str] = None
     prep: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, str]:
-        """Convert to JSON-serializable dict."""
+    def __post_init__(self):
+        if self.verb is not None:
+            object.__setattr__(self, "verb", sys.intern(self.verb))
+        if self.direction is not None:
+            object.__setattr__(self, "direction", sys.intern(self.direction))
+        if self.prep is not None:
+            object.__setattr__(self, "prep", sys.intern(self.prep))
+
         d = {"verb": self.verb}
         if self.direction:
             d["direction"] = self.direction
@@ -51,7 +131,16 @@ class Action:
             d["indirect-object"] = self.indirect_object
         if self.prep:
             d["prep"] = self.prep
-        return d
+        object.__setattr__(self, "_dict", d)
+        object.__setattr__(self, "_line", _json_dumps(d) + b"\n")
+
+    def to_dict(self) -> Dict[str, str]:
+        """Convert to JSON-serializable dict (a fresh copy, safe to modify)."""
+        return dict(self._dict)
+
+    def as_line(self) -> bytes:
+        """Encoded JSON line, as written to the Clork subprocess."""
+        return self._line
 
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "Action":
@@ -76,6 +165,88 @@ class Action:
         return " ".join(parts)
 
 
+class ClorkObservation(Mapping):
+    """
+    One game state observation, as returned by reset() and step().
+
+    A read-only view of the decoded response; use to_dict() for a plain dict
+    (e.g. to serialize it).
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Observation as a plain dict (e.g. for json.dumps)."""
+        return dict(self._data)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def __repr__(self) -> str:
+        return f"ClorkObservation({self._data!r})"
+
+
+@functools.lru_cache(maxsize=8)
+def _jvm_env(java_opts: Tuple[str, ...]) -> Dict[str, str]:
+    """Child environment with JVM_OPTS set, built once per distinct java_opts."""
+    return {**os.environ, "JVM_OPTS": " ".join(java_opts)}
+
+
+# Action factories for valid_actions(), one per action shape. Actions are
+# immutable and the game's vocabulary is small, so each distinct action is
+# built (and its JSON line encoded) once and then shared across ticks.
+
+@functools.lru_cache(maxsize=None)
+def _meta_action(verb: str) -> Action:
+    return Action(verb=verb)
+
+
+@functools.lru_cache(maxsize=None)
+def _move_action(direction: str) -> Action:
+    return Action(verb="go", direction=direction)
+
+
+@functools.lru_cache(maxsize=4096)
+def _object_action(verb: str, direct_object: str) -> Action:
+    return Action(verb=verb, direct_object=direct_object)
+
+
+@functools.lru_cache(maxsize=4096)
+def _two_object_action(verb: str, direct_object: str, prep: str, indirect_object: str) -> Action:
+    return Action(verb=verb, direct_object=direct_object, prep=prep, indirect_object=indirect_object)
+
+
+# String shorthand parsers for ClorkEnv.step(), keyed by
+# (word count capped at 4, whether the first word is a direction)
+_ACTION_STRING_PARSERS = {
+    **{(n, True): lambda p: Action(verb="go", direction=p[0]) for n in range(1, 5)},
+    # Simple verb
+    (1, False): lambda p: Action(verb=p[0]),
+    # Verb + object
+    (2, False): lambda p: Action(verb=p[0], direct_object=p[1]),
+    # Verb + multi-word object
+    (3, False): lambda p: Action(verb=p[0], direct_object=" ".join(p[1:])),
+    # Verb + object + prep + object
+    (4, False): lambda p: Action(
+        verb=p[0], direct_object=p[1], prep=p[2], indirect_object=p[3]
+    ),
+}
+
+
 class ClorkEnv:
     """
     OpenAI Gym-style environment for Clork.
@@ -88,12 +259,18 @@ class ClorkEnv:
         reward_weights: Custom weights for reward calculation (optional)
     """
 
+    # Pre-encoded lines for the fixed control actions
+    _QUIT_LINE = b'{"verb":"quit"}\n'
+    _RESET_LINE = b'{"verb":"reset"}\n'
+    _STATS_LINE = b'{"verb":"stats"}\n'
+
     def __init__(
         self,
         clork_dir: Optional[str] = None,
         use_rewards: bool = True,
         reward_weights: Optional[Dict[str, float]] = None,
         java_opts: Optional[List[str]] = None,
+        framed: bool = False,
     ):
         """
         Initialize the Clork environment.
@@ -103,16 +280,28 @@ class ClorkEnv:
             use_rewards: Whether to use reward-tracking mode
             reward_weights: Custom reward weights (see default_reward_weights)
             java_opts: Additional JVM options
+            framed: Use length-prefixed frames instead of JSON lines on the
+                    pipes (--ml-framed), avoiding newline scans on both sides
         """
         self.clork_dir = Path(clork_dir) if clork_dir else self._find_clork_dir()
         self.use_rewards = use_rewards
         self.reward_weights = reward_weights
         self.java_opts = java_opts or []
+        self.framed = framed
 
         self._process: Optional[subprocess.Popen] = None
-        self._observation: Optional[Dict[str, Any]] = None
+        self._observation: Optional[ClorkObservation] = None
         self._last_reward: float = 0.0
         self._done: bool = False
+        # valid_actions() results for the current observation, keyed by
+        # include_dangerous; cleared whenever the observation changes
+        self._actions_cache: Dict[bool, List[Action]] = {}
+        # Reused for encoding dict actions, so each step does not build a
+        # fresh "payload + newline" bytes object
+        self._line_buf = bytearray()
+        # Bytes read from stdout but not yet consumed as a message. stdout is
+        # read with os.read() on the raw fd, bypassing the file object.
+        self._read_buf = bytearray()
 
     @staticmethod
     def _find_clork_dir() -> Path:
@@ -147,7 +336,7 @@ class ClorkEnv:
             "invalid-action": -0.1,
         }
 
-    def _start_process(self):
+    def _start_process(self, extra_args: Tuple[str, ...] = ()):
         """Start the Clork subprocess."""
         if self._process is not None:
             self.close()
@@ -156,10 +345,12 @@ class ClorkEnv:
         cmd = ["lein", "run", "--ml"]
         if self.use_rewards:
             cmd.append("--ml-rewards")
+        if self.framed:
+            cmd.append("--ml-framed")
+        cmd.extend(extra_args)
 
-        env = os.environ.copy()
-        if self.java_opts:
-            env["JVM_OPTS"] = " ".join(self.java_opts)
+        # Without JVM options the child simply inherits our environment
+        env = _jvm_env(tuple(self.java_opts)) if self.java_opts else None
 
         self._process = subprocess.Popen(
             cmd,
@@ -167,63 +358,131 @@ class ClorkEnv:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             cwd=str(self.clork_dir),
-            text=True,
-            bufsize=1,  # Line buffered
             env=env,
         )
+        self._read_buf.clear()
+
+    def _write_line(self, line: bytes | bytearray):
+        """
+        Write one newline-terminated JSON message using the active framing.
 
-    def _send_action(self, action: Dict[str, str]) -> Dict[str, Any]:
-        """Send an action and receive the response."""
+        Writes are buffered; callers flush stdin once they are done writing.
+        """
+        stdin = self._process.stdin
+        if self.framed:
+            # Same payload, minus the newline, behind a length header
+            stdin.write(_FRAME_HEADER.pack(len(line) - 1))
+            stdin.write(memoryview(line)[:-1])
+        else:
+            stdin.write(line)
+
+    def _fill_read_buf(self) -> bool:
+        """Append the next chunk from stdout to the read buffer; False at EOF."""
+        chunk = os.read(self._process.stdout.fileno(), _READ_SIZE)
+        if not chunk:
+            return False
+        self._read_buf += chunk
+        return True
+
+    def _read_message(self) -> bytes | bytearray:
+        """Read one JSON message; returns b"" at end of stream."""
+        buf = self._read_buf
+        if self.framed:
+            while len(buf) < _FRAME_HEADER.size:
+                if not self._fill_read_buf():
+                    return b""
+            (length,) = _FRAME_HEADER.unpack_from(buf)
+            end = _FRAME_HEADER.size + length
+            while len(buf) < end:
+                if not self._fill_read_buf():
+                    return b""
+            message = buf[_FRAME_HEADER.size:end]
+        else:
+            # Only scan bytes that arrived since the last search
+            scanned = 0
+            while (newline := buf.find(b"\n", scanned)) < 0:
+                scanned = len(buf)
+                if not self._fill_read_buf():
+                    return b""
+            end = newline + 1
+            message = buf[:end]
+
+        del buf[:end]
+        return message
+
+    def _send_action(self, action: Action | Dict[str, str] | List[Dict[str, Any]] | bytes) -> Any:
+        """Send an action (or a batch-mode request) and receive the response."""
         if self._process is None:
             raise RuntimeError("Environment not started. Call reset() first.")
 
-        # Send action as JSON line
-        json_line = json.dumps(action) + "\n"
-        self._process.stdin.write(json_line)
+        self._write_action(action)
         self._process.stdin.flush()
+        return _json_loads(self._read_response())
 
-        # Read response
-        response_line = self._process.stdout.readline()
+    def _write_action(self, action: Action | Dict[str, str] | List[Dict[str, Any]] | bytes):
+        """
+        Write an action without flushing. Actions carry their line
+        pre-encoded; bytes are taken as an already encoded line.
+        """
+        if isinstance(action, Action):
+            self._write_line(action._line)
+        elif isinstance(action, bytes):
+            self._write_line(action)
+        else:
+            line_buf = self._line_buf
+            line_buf.clear()
+            line_buf += _json_dumps(action)
+            line_buf.append(0x0A)
+            self._write_line(line_buf)
+
+    def _read_response(self) -> bytes | bytearray:
+        """Read the (still encoded) response to one action."""
+        response_line = self._read_message()
         if not response_line:
             # Process may have died
-            stderr = self._process.stderr.read()
+            stderr = self._process.stderr.read().decode("utf-8", "replace")
             raise RuntimeError(f"Clork process died unexpectedly: {stderr}")
 
-        return json.loads(response_line)
+        return response_line
 
-    def _read_initial_state(self) -> Dict[str, Any]:
+    def _read_initial_state(self) -> Any:
         """Read the initial state after starting the process."""
         if self._process is None:
             raise RuntimeError("Process not started")
 
-        response_line = self._process.stdout.readline()
+        response_line = self._read_message()
         if not response_line:
-            stderr = self._process.stderr.read()
+            stderr = self._process.stderr.read().decode("utf-8", "replace")
             raise RuntimeError(f"Failed to read initial state: {stderr}")
 
-        return json.loads(response_line)
+        return _json_loads(response_line)
 
-    def reset(self) -> Dict[str, Any]:
+    def reset(self) -> ClorkObservation:
         """
         Reset the environment to initial state.
 
         Returns:
-            Initial observation dictionary
+            Initial observation (a read-only, dict-like ClorkObservation)
         """
         if self._process is None:
             self._start_process()
-            self._observation = self._read_initial_state()
+            response = self._read_initial_state()
         else:
             # Send reset command
-            response = self._send_action({"verb": "reset"})
-            self._observation = response
+            response = self._send_action(self._RESET_LINE)
+
+        return self._reset_observation(response)
 
+    def _reset_observation(self, response: Dict[str, Any]) -> ClorkObservation:
+        """Install the observation returned by a reset."""
+        self._observation = ClorkObservation(response)
+        self._actions_cache.clear()
         self._last_reward = 0.0
         self._done = False
 
         return self._observation
 
-    def step(self, action: Action | Dict[str, str] | str) -> Tuple[Dict[str, Any], float, bool, Dict[str, Any]]:
+    def step(self, action: Action | Dict[str, str] | str) -> Tuple[ClorkObservation, float, bool, Dict[str, Any]]:
         """
         Take an action in the environment.
 
@@ -235,84 +494,130 @@ class ClorkEnv:
 
         Returns:
             Tuple of (observation, reward, done, info)
-            - observation: New game state
+            - observation: New game state (read-only ClorkObservation)
             - reward: Reward from this action (composite reward if use_rewards=True)
             - done: Whether the game is over
             - info: Additional information (rewards breakdown, session stats)
         """
-        # Convert action to dict
-        if isinstance(action, Action):
-            action_dict = action.to_dict()
-        elif isinstance(action, str):
-            action_dict = self._parse_action_string(action)
-        else:
-            action_dict = action
+        # Strings are parsed to (cached) Actions; Actions and dicts are sent as-is
+        if isinstance(action, str):
+            action = self._parse_action_string(action)
 
         # Send action
-        response = self._send_action(action_dict)
-        self._observation = response
+        return self._apply_response(self._send_action(action))
+
+    def step_many(
+        self, actions: Sequence[Action | Dict[str, str] | str]
+    ) -> List[Tuple[ClorkObservation, float, bool, Dict[str, Any]]]:
+        """
+        Take a sequence of actions, pipelining the round-trips.
+
+        Actions are written ahead of reading their responses (up to
+        _PIPELINE_BYTES of requests at a time), so a sequence costs about
+        one round-trip of latency per batch instead of one per action. The
+        effect is the same as calling step() for each action in order; note
+        that actions after a game-over are still sent.
+
+        Returns:
+            List of (observation, reward, done, info) tuples, one per action
+        """
+        if self._process is None:
+            raise RuntimeError("Environment not started. Call reset() first.")
+
+        # Bytes each request adds on the wire beyond its JSON line
+        overhead = _FRAME_HEADER.size - 1 if self.framed else 0
+        results = []
+        unread = 0
+        unread_bytes = 0
+        for action in actions:
+            if isinstance(action, str):
+                action = self._parse_action_string(action)
+            if isinstance(action, Action):
+                line = action._line
+            elif isinstance(action, bytes):
+                line = action
+            else:
+                line = _json_dumps(action) + b"\n"
+
+            size = len(line) + overhead
+            if unread and unread_bytes + size > _PIPELINE_BYTES:
+                # Collect the responses in flight before writing any more
+                self._process.stdin.flush()
+                for _ in range(unread):
+                    results.append(self._apply_response(_json_loads(self._read_response())))
+                unread = unread_bytes = 0
+
+            self._write_line(line)
+            unread += 1
+            unread_bytes += size
+
+        self._process.stdin.flush()
+        for _ in range(unread):
+            results.append(self._apply_response(_json_loads(self._read_response())))
+
+        return results
+
+    def _apply_response(
+        self, response: Dict[str, Any]
+    ) -> Tuple[ClorkObservation, float, bool, Dict[str, Any]]:
+        """Install the decoded response to an action; see step()."""
+        self._observation = ClorkObservation(response)
+        self._actions_cache.clear()
+
+        # Each field is looked up once and reused for the reward and info
+        get = response.get
+        rewards = get("rewards")
+        session_stats = get("session-stats")
+        message = get("message")
 
         # Extract reward
-        if self.use_rewards and "composite-reward" in response:
-            reward = response["composite-reward"]
-        elif "rewards" in response and "score-delta" in response["rewards"]:
-            reward = response["rewards"]["score-delta"]
-        else:
-            reward = 0.0
+        reward = get("composite-reward") if self.use_rewards else None
+        if reward is None:
+            reward = rewards.get("score-delta", 0.0) if rewards else 0.0
 
         self._last_reward = reward
 
-        # Check if done
-        done = response.get("game-over", False)
+        # Check if done (the CLI sends null until the game has ended)
+        done = bool(get("game-over"))
         self._done = done
 
         # Build info dict
         info = {}
-        if "rewards" in response:
-            info["rewards"] = response["rewards"]
-        if "session-stats" in response:
-            info["session-stats"] = response["session-stats"]
-        if "message" in response:
-            info["message"] = response["message"]
+        if rewards is not None:
+            info["rewards"] = rewards
+        if session_stats is not None:
+            info["session-stats"] = session_stats
+        if message is not None:
+            info["message"] = message
 
         return self._observation, reward, done, info
 
-    def _parse_action_string(self, action_str: str) -> Dict[str, str]:
-        """Parse a simple action string into action dict."""
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _parse_action_string(action_str: str) -> Action:
+        """
+        Parse a simple action string into an Action.
+
+        Results are memoized: scripted agents repeat the same few strings, and
+        the returned Action is immutable with its JSON line already encoded.
+        """
         parts = action_str.lower().split()
 
         if not parts:
-            return {"verb": "look"}
-
-        # Direction shortcuts
-        directions = {
-            "n", "s", "e", "w", "ne", "nw", "se", "sw",
-            "north", "south", "east", "west",
-            "northeast", "northwest", "southeast", "southwest",
-            "up", "down", "u", "d", "in", "out"
-        }
-
-        if parts[0] in directions:
-            return {"verb": "go", "direction": parts[0]}
-
-        # Simple verb
-        if len(parts) == 1:
-            return {"verb": parts[0]}
-
-        # Verb + object
-        if len(parts) == 2:
-            return {"verb": parts[0], "direct-object": parts[1]}
+            return Action(verb="look")
 
-        # Verb + object + prep + object
-        if len(parts) >= 4:
-            return {
-                "verb": parts[0],
-                "direct-object": parts[1],
-                "prep": parts[2],
-                "indirect-object": parts[3],
-            }
+        key = (min(len(parts), 4), parts[0] in _DIRECTIONS)
+        return _ACTION_STRING_PARSERS[key](parts)
 
-        return {"verb": parts[0], "direct-object": " ".join(parts[1:])}
+    @staticmethod
+    def _action_dict(action: Action | Dict[str, str] | str) -> Dict[str, str]:
+        """Normalize any accepted action form to its wire dict."""
+        if isinstance(action, str):
+            action = ClorkEnv._parse_action_string(action)
+        if isinstance(action, Action):
+            # Only serialized, never handed out, so the copy can be skipped
+            return action._dict
+        return action
 
     # Meta verbs that should be excluded from random action selection
     # These either end the game or have side effects unsuitable for training
@@ -332,42 +637,53 @@ class ClorkEnv:
         if self._observation is None:
             raise RuntimeError("No observation available. Call reset() first.")
 
-        actions = []
+        cached = self._actions_cache.get(include_dangerous)
+        if cached is not None:
+            return list(cached)
+
         va = self._observation.get("valid-actions", {})
+        excluded = () if include_dangerous else self.EXCLUDED_META_VERBS
 
         # Meta verbs (look, inventory, etc.)
-        for verb in va.get("meta-verbs", []):
-            if include_dangerous or verb not in self.EXCLUDED_META_VERBS:
-                actions.append(Action(verb=verb))
+        actions = [
+            _meta_action(verb)
+            for verb in va.get("meta-verbs", ())
+            if verb not in excluded
+        ]
 
         # Movement
-        movement = va.get("movement", {})
-        for direction in movement.get("directions", []):
-            actions.append(Action(verb="go", direction=direction))
+        actions += [
+            _move_action(direction)
+            for direction in va.get("movement", {}).get("directions", ())
+        ]
 
         # Object actions
-        object_actions = va.get("object-actions", {})
-        for obj_id, obj_info in object_actions.items():
-            for verb in obj_info.get("verbs", []):
-                actions.append(Action(verb=verb, direct_object=obj_id))
+        actions += [
+            _object_action(verb, obj_id)
+            for obj_id, obj_info in va.get("object-actions", {}).items()
+            for verb in obj_info.get("verbs", ())
+        ]
 
         # Two-object actions
-        for two_obj in va.get("two-object-actions", []):
-            actions.append(Action(
-                verb=two_obj.get("verb"),
-                direct_object=two_obj.get("direct-object"),
-                prep=two_obj.get("prep"),
-                indirect_object=two_obj.get("indirect-object"),
-            ))
-
-        return actions
+        actions += [
+            _two_object_action(
+                two_obj.get("verb"),
+                two_obj.get("direct-object"),
+                two_obj.get("prep"),
+                two_obj.get("indirect-object"),
+            )
+            for two_obj in va.get("two-object-actions", ())
+        ]
+
+        self._actions_cache[include_dangerous] = actions
+        return list(actions)
 
     def valid_action_dicts(self) -> List[Dict[str, str]]:
         """Get valid actions as list of dicts (for JSON serialization)."""
         return [a.to_dict() for a in self.valid_actions()]
 
     @property
-    def observation(self) -> Optional[Dict[str, Any]]:
+    def observation(self) -> Optional[ClorkObservation]:
         """Current observation."""
         return self._observation
 
@@ -427,22 +743,60 @@ class ClorkEnv:
         """Request current session statistics."""
         if self._process is None:
             return {}
-        response = self._send_action({"verb": "stats"})
+        response = self._send_action(self._STATS_LINE)
         return response.get("session-stats", {})
 
     def close(self):
         """Close the environment and cleanup subprocess."""
         if self._process is not None:
-            try:
-                # Try graceful shutdown
-                self._process.stdin.write(json.dumps({"verb": "quit"}) + "\n")
-                self._process.stdin.flush()
-                self._process.wait(timeout=2)
-            except Exception:
-                # Force kill if needed
-                self._process.kill()
-            finally:
-                self._process = None
+            self._request_quit()
+            self._finish_close()
+
+    def _request_quit(self):
+        """Ask the subprocess to exit, without waiting for it."""
+        try:
+            # Try graceful shutdown; closing stdin also signals EOF
+            self._write_line(self._QUIT_LINE)
+            self._process.stdin.close()
+        except Exception:
+            # Already gone; _finish_close() reaps or kills it
+            pass
+
+    def _finish_close(self, timeout: float = 2.0):
+        """Wait for the subprocess to exit after _request_quit(), then drop it."""
+        try:
+            self._wait_for_exit(timeout)
+        except Exception:
+            # Force kill if needed
+            self._process.kill()
+            self._process.wait()
+        finally:
+            self._process = None
+
+    def _wait_for_exit(self, timeout: float):
+        """
+        Wait for the subprocess to exit.
+
+        Popen.wait(timeout) sleeps and polls; instead block on the stdout pipe
+        until it reaches EOF (the process exited), discarding any trailing
+        output, and only then reap the process.
+        """
+        if sys.platform == "win32":
+            # selectors cannot wait on pipes on Windows
+            self._process.wait(timeout=timeout)
+            return
+
+        deadline = time.monotonic() + timeout
+        fd = self._process.stdout.fileno()
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    raise subprocess.TimeoutExpired(self._process.args, timeout)
+                if not os.read(fd, _READ_SIZE):
+                    break
+        self._process.wait(timeout=max(deadline - time.monotonic(), 0))
 
     def __enter__(self):
         """Context manager entry."""
@@ -457,29 +811,107 @@ class ClorkEnv:
         self.close()
 
 
+class _SharedGameHandle(ClorkEnv):
+    """
+    One game of a shared-process ClorkVecEnv.
+
+    Holds that game's observation, so the read-only properties and
+    valid_actions() work as on a ClorkEnv, but has no process of its own:
+    the game can only be reset or stepped through the ClorkVecEnv.
+    """
+
+    def _not_supported(self, *args, **kwargs):
+        raise RuntimeError(
+            "This env is one game of a shared-process ClorkVecEnv; "
+            "reset and step it through the ClorkVecEnv"
+        )
+
+    reset = step = step_many = get_stats = _not_supported
+
+
 class ClorkVecEnv:
     """
     Vectorized environment for parallel training.
 
-    Runs multiple Clork instances in parallel for faster training.
+    Runs multiple Clork instances in parallel for faster training. Each
+    environment's request/response round-trip runs on its own worker thread,
+    so the blocking pipe reads overlap instead of adding up.
+
+    With shared_process=True, a single Clork process hosts every game
+    (--ml-num-envs) and each step is one batched round-trip; self.envs are
+    then handles holding per-game observations, which raise RuntimeError if
+    reset(), step(), step_many() or get_stats() is called on them directly.
+
+    Per-environment scores, rewards and done flags are also kept as columns
+    (one entry per env), updated in place on every reset()/step(). They are
+    array.array buffers, so np.asarray() can view them without copying or
+    looping over the environments.
     """
 
-    def __init__(self, num_envs: int = 4, **env_kwargs):
+    def __init__(self, num_envs: int = 4, shared_process: bool = False, **env_kwargs):
         """
         Initialize vectorized environment.
 
         Args:
             num_envs: Number of parallel environments
+            shared_process: Run all games in one Clork process (one JVM)
             **env_kwargs: Arguments passed to each ClorkEnv
         """
         self.num_envs = num_envs
-        self.envs = [ClorkEnv(**env_kwargs) for _ in range(num_envs)]
-
-    def reset(self) -> List[Dict[str, Any]]:
+        self.shared_process = shared_process
+        env_type = _SharedGameHandle if shared_process else ClorkEnv
+        self.envs = [env_type(**env_kwargs) for _ in range(num_envs)]
+
+        # Owns the batch-mode process; never used as a game itself
+        self._host = ClorkEnv(**env_kwargs) if shared_process else None
+        # Worker threads for the per-env processes; started by _map()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        self._scores = array("i", [0]) * num_envs
+        self._rewards = array("d", [0.0]) * num_envs
+        self._dones = array("B", [0]) * num_envs
+
+    def _map(self, fn, *args) -> List[Any]:
+        """Run fn(env, *per_env_args) on every env concurrently, in env order."""
+        if self._pool is None:
+            # Started on first use (and again after close()), so a closed
+            # vec env can be reset like a fresh one
+            self._pool = ThreadPoolExecutor(max_workers=max(self.num_envs, 1))
+        futures = [self._pool.submit(fn, env, *a) for env, *a in zip(self.envs, *args)]
+        return [f.result() for f in futures]
+
+    def _host_request(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send one batch-mode request and return its per-entry responses."""
+        responses = self._host._send_action(batch)
+        if isinstance(responses, dict):
+            raise RuntimeError(f"Clork batch request failed: {responses.get('error')}")
+        return responses
+
+    def reset(self) -> List[ClorkObservation]:
         """Reset all environments."""
-        return [env.reset() for env in self.envs]
-
-    def step(self, actions: List[Any]) -> Tuple[List[Dict], List[float], List[bool], List[Dict]]:
+        if self._host is None:
+            observations = self._map(ClorkEnv.reset)
+        else:
+            if self._host._process is None:
+                self._host._start_process(("--ml-num-envs", str(self.num_envs)))
+                responses = self._host._read_initial_state()
+            else:
+                responses = self._host_request(
+                    [{"i": i, "a": {"verb": "reset"}} for i in range(self.num_envs)]
+                )
+            observations = [
+                env._reset_observation(response)
+                for env, response in zip(self.envs, responses)
+            ]
+
+        for i, env in enumerate(self.envs):
+            self._scores[i] = env.score
+            self._rewards[i] = 0.0
+            self._dones[i] = False
+
+        return observations
+
+    def step(self, actions: List[Any]) -> Tuple[List[ClorkObservation], List[float], List[bool], List[Dict]]:
         """
         Take actions in all environments.
 
@@ -489,7 +921,21 @@ class ClorkVecEnv:
         Returns:
             Tuple of (observations, rewards, dones, infos)
         """
-        results = [env.step(action) for env, action in zip(self.envs, actions)]
+        if self._host is None:
+            results = self._map(ClorkEnv.step, actions)
+        else:
+            responses = self._host_request(
+                [{"i": i, "a": ClorkEnv._action_dict(a)} for i, a in enumerate(actions)]
+            )
+            results = [
+                env._apply_response(response)
+                for env, response in zip(self.envs, responses)
+            ]
+
+        for i, (env, (_, reward, done, _)) in enumerate(zip(self.envs, results)):
+            self._scores[i] = env.score
+            self._rewards[i] = reward
+            self._dones[i] = done
 
         observations = [r[0] for r in results]
         rewards = [r[1] for r in results]
@@ -498,14 +944,50 @@ class ClorkVecEnv:
 
         return observations, rewards, dones, infos
 
+    @property
+    def scores(self) -> array:
+        """Game score of each environment (C int column)."""
+        return self._scores
+
+    @property
+    def rewards(self) -> array:
+        """Reward from each environment's last step (C double column)."""
+        return self._rewards
+
+    @property
+    def dones(self) -> array:
+        """Game-over flag of each environment (unsigned char column)."""
+        return self._dones
+
+    @property
+    def rooms(self) -> List[Optional[str]]:
+        """Current room ID of each environment."""
+        # Not a stored column: reading it decodes each observation
+        return [env.room for env in self.envs]
+
     def valid_actions(self) -> List[List[Action]]:
         """Get valid actions for all environments."""
+        # No I/O here, so threads would only add overhead under the GIL
         return [env.valid_actions() for env in self.envs]
 
     def close(self):
         """Close all environments."""
-        for env in self.envs:
-            env.close()
+        running = [
+            env for env in self.envs + [self._host]
+            if env is not None and env._process is not None
+        ]
+
+        # Ask every process to quit first so they all shut down concurrently,
+        # then reap them
+        for env in running:
+            env._request_quit()
+        if self._pool is not None:
+            list(self._pool.map(ClorkEnv._finish_close, running))
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        else:
+            for env in running:
+                env._finish_close()
 
     def __enter__(self):
         return self
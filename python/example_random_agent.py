@@ -14,13 +14,22 @@ import random
 from clork_env import ClorkEnv, Action
 
 
-def run_episode(env: ClorkEnv, max_steps: int, verbose: bool = False) -> dict:
+def run_episode(env: ClorkEnv, max_steps: int, verbose: bool = False,
+                move_bias: float = 1.0) -> dict:
     """
     Run one episode with a random agent.
 
+    Args:
+        move_bias: Relative weight of movement ("go") actions versus all
+                   other actions; 1.0 samples uniformly
+
     Returns:
         Episode statistics including total reward and session stats
     """
+    # Also rejects NaN, which random.choices would sample from arbitrarily
+    if not move_bias > 0:
+        raise ValueError(f"move_bias must be positive, got {move_bias}")
+
     obs = env.reset()
     total_reward = 0.0
     steps = 0
@@ -30,6 +39,15 @@ def run_episode(env: ClorkEnv, max_steps: int, verbose: bool = False) -> dict:
         print(f"Starting in: {env.room_name}")
         print(f"{'='*60}")
 
+    # Pick the sampler once, so each step is a single call
+    if move_bias == 1.0:
+        sample = random.choice
+    else:
+        def sample(actions):
+            # One weighted draw instead of filtering movement actions out
+            weights = [move_bias if a.verb == "go" else 1.0 for a in actions]
+            return random.choices(actions, weights=weights)[0]
+
     for step in range(max_steps):
         # Get valid actions
         actions = env.valid_actions()
@@ -38,7 +56,7 @@ def run_episode(env: ClorkEnv, max_steps: int, verbose: bool = False) -> dict:
                 print("No valid actions available!")
             break
 
-        action = random.choice(actions)
+        action = sample(actions)
 
         # Take the action
         obs, reward, done, info = env.step(action)
@@ -74,8 +92,13 @@ def main():
     parser.add_argument("--episodes", type=int, default=1, help="Number of episodes")
     parser.add_argument("--verbose", "-v", action="store_true", help="Print actions")
     parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument("--move-bias", type=float, default=1.0,
+                        help="Weight of movement actions relative to others")
     args = parser.parse_args()
 
+    if not args.move_bias > 0:
+        parser.error("--move-bias must be positive")
+
     if args.seed is not None:
         random.seed(args.seed)
 
@@ -90,7 +113,8 @@ def main():
         for ep in range(args.episodes):
             print(f"\n--- Episode {ep+1}/{args.episodes} ---")
 
-            stats = run_episode(env, args.steps, verbose=args.verbose)
+            stats = run_episode(env, args.steps, verbose=args.verbose,
+                                move_bias=args.move_bias)
             all_stats.append(stats)
 
             print(f"\nEpisode {ep+1} Results:")
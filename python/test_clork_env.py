@@ -0,0 +1,108 @@
+"""
+Tests for the Clork Python wrapper.
+
+These run the wrapper against a small stand-in for `lein run --ml` (written
+to a temporary directory and put first on PATH), so they need neither a JVM
+nor Leiningen:
+
+    cd python && python -m unittest test_clork_env
+"""
+
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from clork_env import ClorkEnv, ClorkVecEnv
+
+
+# Answers like the real CLI on a live game, including "game-over": null
+# (ml/game-over? is nil until the game has ended)
+FAKE_LEIN = r'''#!{python}
+import json, struct, sys
+
+args = sys.argv[1:]
+framed = "--ml-framed" in args
+num_envs = int(args[args.index("--ml-num-envs") + 1]) if "--ml-num-envs" in args else None
+stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+
+def read():
+    if framed:
+        header = stdin.read(4)
+        return stdin.read(struct.unpack(">I", header)[0]) if len(header) == 4 else None
+    return stdin.readline() or None
+
+def write(obj):
+    data = json.dumps(obj).encode()
+    stdout.write(struct.pack(">I", len(data)) + data if framed else data + b"\n")
+    stdout.flush()
+
+def observation(moves):
+    return {{"score": 0, "moves": moves, "game-over": None,
+             "room": {{"id": "west-of-house", "name": "West of House"}},
+             "message": "", "valid-actions": {{}}}}
+
+if num_envs:
+    moves = [0] * num_envs
+    write([observation(0) for _ in moves])
+    while (request := read()) is not None:
+        batch = json.loads(request)
+        if isinstance(batch, dict):
+            break
+        for entry in batch:
+            moves[entry["i"]] += 1
+        write([observation(moves[entry["i"]]) for entry in batch])
+else:
+    moves = 0
+    write(observation(moves))
+    while (request := read()) is not None:
+        if json.loads(request).get("verb") == "quit":
+            break
+        moves += 1
+        write(observation(moves))
+'''
+
+
+class FakeClorkTestCase(unittest.TestCase):
+    """Runs each test with the fake `lein` first on PATH."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.clork_dir = tmp.name
+
+        lein = Path(tmp.name) / "lein"
+        lein.write_text(FAKE_LEIN.format(python=sys.executable))
+        lein.chmod(lein.stat().st_mode | stat.S_IXUSR)
+
+        path = tmp.name + os.pathsep + os.environ.get("PATH", "")
+        patcher = mock.patch.dict(os.environ, {"PATH": path})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestNullGameOver(FakeClorkTestCase):
+    """A live game reports "game-over": null; done must still be a bool."""
+
+    def test_env_step(self):
+        with ClorkEnv(clork_dir=self.clork_dir) as env:
+            env.reset()
+            _, _, done, _ = env.step("look")
+            self.assertIs(done, False)
+
+    def test_vec_env_step(self):
+        for shared_process in (False, True):
+            with self.subTest(shared_process=shared_process):
+                with ClorkVecEnv(num_envs=2, shared_process=shared_process,
+                                 clork_dir=self.clork_dir) as vec:
+                    vec.reset()
+                    _, _, dones, _ = vec.step(["look", "north"])
+                    self.assertEqual(dones, [False, False])
+                    self.assertEqual(list(vec.dones), [0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -133,6 +133,8 @@
   (println "  --seed N               Set random seed for reproducibility")
   (println "  --ml                   Run in ML training mode (JSON lines on stdin/stdout)")
   (println "  --ml-rewards           Include reward signals in ML mode output")
+  (println "  --ml-framed            Use length-prefixed frames instead of JSON lines")
+  (println "  --ml-num-envs N        Host N games in one process (batched ML protocol)")
   (println "  --help, -h             Show this help message")
   (println "")
   (println "ML Mode:")
@@ -141,6 +143,7 @@
   (println "  - Reads actions as JSON from stdin")
   (println "  - Action format: {\"verb\": \"look\"} or {\"verb\": \"go\", \"direction\": \"north\"}")
   (println "  - Special actions: {\"verb\": \"quit\"}, {\"verb\": \"reset\"}, {\"verb\": \"stats\"}")
+  (println "  - With --ml-framed, each message is a 4-byte big-endian length + UTF-8 JSON")
   (println "")
   (println "  With --ml-rewards, output includes:")
   (println "  - Reward signals (score_delta, novel_room, novel_message, etc.)")
@@ -172,16 +175,29 @@
           seed (when (and (>= seed-idx 0) (< (inc seed-idx) (count args)))
                  (try (Long/parseLong (nth args (inc seed-idx)))
                       (catch Exception _ nil)))
-          use-rewards? (some #{"--ml-rewards"} args)]
+          num-envs-idx (.indexOf (vec args) "--ml-num-envs")
+          num-envs (when (and (>= num-envs-idx 0) (< (inc num-envs-idx) (count args)))
+                     (try (Long/parseLong (nth args (inc num-envs-idx)))
+                          (catch Exception _ nil)))
+          use-rewards? (some #{"--ml-rewards"} args)
+          framed? (boolean (some #{"--ml-framed"} args))]
       ;; Initialize random number generator
       (if seed
         (random/init! seed)
         (random/init!))
-      ;; Run ML mode (with or without rewards)
+      ;; Run ML mode (batched, or single game with or without rewards)
       (try
-        (if use-rewards?
-          (ml/json-line-mode-with-rewards init-game)
-          (ml/json-line-mode init-game))
+        (cond
+          num-envs
+          (ml/batch-mode init-game num-envs
+                         :use-rewards? (boolean use-rewards?)
+                         :framed? framed?)
+
+          use-rewards?
+          (ml/json-line-mode-with-rewards init-game :framed? framed?)
+
+          :else
+          (ml/json-line-mode init-game :framed? framed?))
         (System/exit 0)
         (catch Exception e
           (binding [*out* *err*]
@@ -12,7 +12,9 @@
             [clork.utils :as utils]
             [clork.daemon :as daemon]
             [clojure.data.json :as json])
-  (:import [java.io BufferedReader]))
+  (:import [java.io BufferedInputStream BufferedOutputStream BufferedReader
+            DataInputStream DataOutputStream EOFException InputStream OutputStream]
+           [java.nio.charset StandardCharsets]))
 
 ;;; ---------------------------------------------------------------------------
 ;;; VISIBILITY HELPERS
@@ -634,15 +636,19 @@
   [snapshot]
   (json/write-str (keyword->string snapshot)))
 
+(defn- action<-parsed
+  "Convert a parsed JSON action (string keys and values) to keywords."
+  [parsed]
+  (into {}
+        (map (fn [[k v]]
+               [(keyword k)
+                (if (string? v) (keyword v) v)])
+             parsed)))
+
 (defn action<-json
   "Parse a JSON action string to Clojure map with keywords."
   [json-str]
-  (let [parsed (json/read-str json-str)]
-    (into {}
-          (map (fn [[k v]]
-                 [(keyword k)
-                  (if (string? v) (keyword v) v)])
-               parsed))))
+  (action<-parsed (json/read-str json-str)))
 
 ;;; ---------------------------------------------------------------------------
 ;;; SESSION TRACKING (for reward shaping)
@@ -882,6 +888,52 @@
      :composite-reward composite
      :session new-session}))
 
+;;; ---------------------------------------------------------------------------
+;;; TRANSPORT
+;;; ---------------------------------------------------------------------------
+;;;
+;;; The ML modes exchange one JSON document per message, either as JSON lines
+;;; (the default) or as length-prefixed frames (--ml-framed). A transport is a
+;;; map of {:read-msg (fn [] string-or-nil) :write-msg (fn [string])}, where
+;;; :read-msg returns nil at end of input.
+
+(defn line-transport
+  "Newline-delimited JSON over *in* / *out*."
+  []
+  (let [reader (BufferedReader. *in*)]
+    {:read-msg (fn [] (.readLine reader))
+     :write-msg (fn [s]
+                  (println s)
+                  (flush))}))
+
+(defn framed-transport
+  "Length-prefixed frames over raw byte streams (default System/in and
+   System/out). Each message is a 4-byte big-endian byte count followed by
+   that many bytes of UTF-8 JSON, so neither side scans for newlines."
+  ([]
+   (framed-transport System/in System/out))
+  ([^InputStream in ^OutputStream out]
+   (let [in (DataInputStream. (BufferedInputStream. in))
+         out (DataOutputStream. (BufferedOutputStream. out))]
+     {:read-msg (fn []
+                  (try
+                    (let [buf (byte-array (.readInt in))]
+                      (.readFully in buf)
+                      (String. buf StandardCharsets/UTF_8))
+                    (catch EOFException _ nil)))
+      :write-msg (fn [^String s]
+                   (let [bs (.getBytes s StandardCharsets/UTF_8)]
+                     (.writeInt out (alength bs))
+                     (.write out bs)
+                     (.flush out)))})))
+
+(defn- transport
+  "Select the transport for an ML mode."
+  [framed?]
+  (if framed?
+    (framed-transport)
+    (line-transport)))
+
 ;;; ---------------------------------------------------------------------------
 ;;; REWARD-AWARE JSON-LINES MODE
 ;;; ---------------------------------------------------------------------------
@@ -910,9 +962,12 @@
    Special actions:
    - {\"verb\": \"quit\"} - Exit and return final stats
    - {\"verb\": \"reset\"} - Restart game (keeps session stats for comparison)
-   - {\"verb\": \"stats\"} - Return session statistics without taking action"
-  [init-fn & {:keys [reward-weights]}]
-  (let [reader (BufferedReader. *in*)]
+   - {\"verb\": \"stats\"} - Return session statistics without taking action
+
+   With :framed? true, messages use length-prefixed frames instead of lines
+   (see framed-transport)."
+  [init-fn & {:keys [reward-weights framed?]}]
+  (let [{:keys [read-msg write-msg]} (transport framed?)]
     (loop [game-state (init-fn)
            session (-> (initial-session)
                        ;; Add starting room to visited
@@ -930,11 +985,10 @@
                                                 (compute-composite-reward last-rewards)))
                      true
                      (assoc :session-stats (session-stats session)))]
-        (println (snapshot->json output))
-        (flush))
+        (write-msg (snapshot->json output)))
 
       ;; Read action from stdin
-      (if-let [line (.readLine reader)]
+      (if-let [line (read-msg)]
         (let [action (try
                        (action<-json line)
                        (catch Exception e
@@ -943,22 +997,19 @@
             ;; Invalid JSON
             (= (:verb action) :invalid)
             (do
-              (println (json/write-str {"error" (:error action)}))
-              (flush)
+              (write-msg (json/write-str {"error" (:error action)}))
               (recur game-state session "" nil))
 
             ;; Quit - return final session stats
             (= (:verb action) :quit)
             (do
-              (println (json/write-str {"final_stats" (keyword->string (session-stats session))}))
-              (flush)
+              (write-msg (json/write-str {"final_stats" (keyword->string (session-stats session))}))
               game-state)
 
             ;; Stats - return session stats without action
             (= (:verb action) :stats)
             (do
-              (println (json/write-str {"session_stats" (keyword->string (session-stats session))}))
-              (flush)
+              (write-msg (json/write-str {"session_stats" (keyword->string (session-stats session))}))
               (recur game-state session last-message last-rewards))
 
             ;; Reset - restart game but preserve session for comparison
@@ -981,8 +1032,7 @@
 
         ;; EOF - return final stats
         (do
-          (println (json/write-str {"final_stats" (keyword->string (session-stats session))}))
-          (flush)
+          (write-msg (json/write-str {"final_stats" (keyword->string (session-stats session))}))
           game-state)))))
 
 ;;; ---------------------------------------------------------------------------
@@ -999,18 +1049,20 @@
      - {:verb :quit} or {\"verb\": \"quit\"} - exit
      - {:verb :reset} or {\"verb\": \"reset\"} - restart game
 
+   With :framed? true, messages use length-prefixed frames instead of lines
+   (see framed-transport).
+
    The init-fn should return a fresh, initialized game state.
    Returns the final game state when quit."
-  [init-fn]
-  (let [reader (BufferedReader. *in*)]
+  [init-fn & {:keys [framed?]}]
+  (let [{:keys [read-msg write-msg]} (transport framed?)]
     (loop [game-state (init-fn)
            last-message ""]
       ;; Output current state as JSON line (with message from last action)
-      (println (snapshot->json (state-snapshot game-state :message last-message)))
-      (flush)
+      (write-msg (snapshot->json (state-snapshot game-state :message last-message)))
 
       ;; Read action from stdin
-      (if-let [line (.readLine reader)]
+      (if-let [line (read-msg)]
         (let [action (try
                        (action<-json line)
                        (catch Exception e
@@ -1019,8 +1071,7 @@
             ;; Invalid JSON
             (= (:verb action) :invalid)
             (do
-              (println (json/write-str {"error" (:error action)}))
-              (flush)
+              (write-msg (json/write-str {"error" (:error action)}))
               (recur game-state ""))
 
             ;; Quit
@@ -1038,3 +1089,118 @@
 
         ;; EOF - exit
         game-state))))
+
+;;; ---------------------------------------------------------------------------
+;;; BATCH MODE (many games in one process)
+;;; ---------------------------------------------------------------------------
+;;;
+;;; Runs N independent games behind a single transport so a vectorized
+;;; environment needs one JVM and one round-trip per step instead of N.
+
+(defn- batch-game
+  "Fresh per-game state for batch mode."
+  [init-fn]
+  (let [game-state (init-fn)]
+    {:game-state game-state
+     :session (update (initial-session) :rooms-visited conj (:here game-state))
+     :message ""
+     :rewards nil}))
+
+(defn- batch-game-output
+  "Observation for one game, shaped like the single-game modes' output."
+  [{:keys [game-state session message rewards]} use-rewards?]
+  (cond-> (state-snapshot game-state :message message)
+    (and use-rewards? rewards)
+    (assoc :rewards rewards
+           :composite-reward (compute-composite-reward rewards))
+    use-rewards?
+    (assoc :session-stats (session-stats session))))
+
+(defn- batch-game-step
+  "Apply one action to one game. Returns [new-game output]."
+  [init-fn game action use-rewards?]
+  (case (:verb action)
+    :reset
+    (let [game (batch-game init-fn)]
+      [game (batch-game-output game use-rewards?)])
+
+    :stats
+    [game {:session_stats (session-stats (:session game))}]
+
+    (let [game (if use-rewards?
+                 (let [result (execute-action-with-rewards
+                               (:game-state game) (:session game) action)]
+                   (assoc game
+                          :game-state (:game-state result)
+                          :session (:session result)
+                          :message (:message result)
+                          :rewards (:rewards result)))
+                 (let [{:keys [game-state message]} (execute-action (:game-state game) action)]
+                   (assoc game :game-state game-state :message message)))]
+      [game (batch-game-output game use-rewards?)])))
+
+(defn- batch-entry-valid?
+  "True if a batch entry names an existing game and carries an action object."
+  [num-games entry]
+  (and (map? entry)
+       (let [i (get entry "i")]
+         (and (integer? i) (< -1 i num-games)))
+       (map? (get entry "a"))))
+
+(defn batch-mode
+  "Run num-games independent games over one transport (--ml-num-envs N).
+
+   Protocol:
+   - On startup: send a JSON array with one observation per game
+   - Read a JSON array of {\"i\": game-index, \"a\": action} entries, apply
+     each action to its game in order, and reply with a JSON array of the
+     resulting observations (one per entry, in request order)
+   - {\"verb\": \"reset\"} and {\"verb\": \"stats\"} work per game as in the
+     single-game modes
+   - A bare {\"verb\": \"quit\"} object exits
+   - A malformed request (or an entry whose game index is out of range) gets
+     an {\"error\": ...} reply and leaves every game unchanged
+
+   Observations match json-line-mode, or json-line-mode-with-rewards when
+   :use-rewards? is true. Returns the final vector of game states."
+  [init-fn num-games & {:keys [use-rewards? framed?]}]
+  (let [{:keys [read-msg write-msg]} (transport framed?)
+        games (vec (repeatedly num-games #(batch-game init-fn)))]
+    (write-msg (snapshot->json (mapv #(batch-game-output % use-rewards?) games)))
+    (loop [games games]
+      (if-let [line (read-msg)]
+        (let [request (try
+                        (json/read-str line)
+                        (catch Exception e
+                          {"error" (.getMessage e)}))]
+          (cond
+            ;; Quit
+            (and (map? request) (= "quit" (get request "verb")))
+            (mapv :game-state games)
+
+            ;; Invalid JSON or not a batch
+            (not (sequential? request))
+            (do
+              (write-msg (json/write-str {"error" (get request "error" "expected a JSON array of actions")}))
+              (recur games))
+
+            ;; Unknown game index or missing action - reject the whole batch
+            (not (every? #(batch-entry-valid? num-games %) request))
+            (do
+              (write-msg (json/write-str {"error" (str "each entry needs an action object \"a\" and a game index \"i\" in [0, " num-games ")")}))
+              (recur games))
+
+            ;; Execute batch
+            :else
+            (let [[games outputs]
+                  (reduce (fn [[games outputs] {:strs [i a]}]
+                            (let [[game output] (batch-game-step
+                                                 init-fn (nth games i) (action<-parsed a) use-rewards?)]
+                              [(assoc games i game) (conj outputs output)]))
+                          [games []]
+                          request)]
+              (write-msg (snapshot->json outputs))
+              (recur games))))
+
+        ;; EOF - exit
+        (mapv :game-state games)))))
@@ -1,5 +1,7 @@
 (ns clork.ml-test
   (:require [clojure.test :refer :all]
+            [clojure.data.json :as json]
+            [clojure.string :as str]
             [clork.ml :as ml]
             [clork.game-state :as gs]
             [clork.rooms :as rooms]
@@ -127,6 +129,52 @@
       (is (= :take (:verb action)))
       (is (= :lamp (:direct-object action))))))
 
+(deftest test-framed-transport
+  (testing "frames are a 4-byte big-endian length followed by UTF-8 JSON"
+    (let [out (java.io.ByteArrayOutputStream.)
+          {:keys [write-msg]} (ml/framed-transport (java.io.ByteArrayInputStream. (byte-array 0)) out)]
+      (write-msg "{\"verb\":\"look\"}")
+      (is (= [0 0 0 15] (take 4 (seq (.toByteArray out)))))
+      (is (= "{\"verb\":\"look\"}" (String. (.toByteArray out) 4 15 "UTF-8")))))
+
+  (testing "reads back what was written, then nil at EOF"
+    (let [out (java.io.ByteArrayOutputStream.)
+          writer (ml/framed-transport (java.io.ByteArrayInputStream. (byte-array 0)) out)]
+      ((:write-msg writer) "{\"verb\":\"take\",\"direct-object\":\"lamp\"}")
+      ((:write-msg writer) "{\"verb\":\"quit\"}")
+      (let [{:keys [read-msg]} (ml/framed-transport
+                                (java.io.ByteArrayInputStream. (.toByteArray out))
+                                (java.io.ByteArrayOutputStream.))]
+        (is (= :lamp (:direct-object (ml/action<-json (read-msg)))))
+        (is (= :quit (:verb (ml/action<-json (read-msg)))))
+        (is (nil? (read-msg)))))))
+
+(deftest test-batch-mode
+  (testing "hosts several games and answers each batch entry in order"
+    (let [input (str "[{\"i\": 1, \"a\": {\"verb\": \"look\"}},"
+                     " {\"i\": 0, \"a\": {\"verb\": \"inventory\"}}]\n"
+                     "{\"verb\": \"quit\"}\n")
+          output (with-out-str
+                   (with-in-str input
+                     (ml/batch-mode init-test-state 2)))
+          [initial response] (map json/read-str (str/split-lines output))]
+      (is (= 2 (count initial)))
+      (is (every? #(= "west-of-house" (get-in % ["room" "id"])) initial))
+      (is (= 2 (count response)))
+      (is (.contains (get (first response) "message") "House"))
+      (is (seq (get (second response) "message")))))
+
+  (testing "rejects an out-of-range game index without exiting"
+    (let [input (str "[{\"i\": 2, \"a\": {\"verb\": \"look\"}}]\n"
+                     "[{\"i\": 0, \"a\": {\"verb\": \"look\"}}]\n"
+                     "{\"verb\": \"quit\"}\n")
+          output (with-out-str
+                   (with-in-str input
+                     (ml/batch-mode init-test-state 2)))
+          [_ error response] (map json/read-str (str/split-lines output))]
+      (is (contains? error "error"))
+      (is (= 1 (count response))))))
+
 ;;; ---------------------------------------------------------------------------
 ;;; REWARD SHAPING TESTS
 ;;; ---------------------------------------------------------------------------